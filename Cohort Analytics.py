@@ -0,0 +1,93 @@
+# ==============================
+# Cohort Risk Analytics Page
+# ==============================
+import time
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from model_store import model_version
+from risk_cube import CUBE_DIMENSIONS, build_risk_cube, query_cube
+
+# ---------------- Page Config ----------------
+st.set_page_config(page_title="Cohort Risk Analytics", layout="wide")
+
+# ---------------- Background Gradient ----------------
+st.markdown("""
+<style>
+.stApp {
+    background: linear-gradient(to right, #f3e5f5, #ede7f6);
+}
+.section-header {
+    background: linear-gradient(90deg, #7e57c2, #673ab7);
+    padding: 15px;
+    border-radius: 10px;
+    color: white;
+    text-align: center;
+    margin-bottom: 20px;
+}
+</style>
+""", unsafe_allow_html=True)
+
+# ---------------- Header ----------------
+st.markdown("""
+<div class="section-header">
+    <h1>🏫 Cohort Risk Analytics</h1>
+    <h3>Aggregate depression risk by City, Degree, Profession, Gender and Sleep Duration</h3>
+</div>
+""", unsafe_allow_html=True)
+
+# ---------------- Model & Data ----------------
+model = st.session_state.get("model", None)
+df = st.session_state.get("data", None)
+if df is None:
+    try:
+        df = pd.read_csv("student_depression_dataset.csv")
+        st.session_state["data"] = df
+    except FileNotFoundError:
+        st.error("'student_depression_dataset.csv' not found.")
+        st.stop()
+
+if model is None:
+    st.warning("⚠️ Please train a model first on the training page.")
+    st.stop()
+
+
+# The whole dataset is scored once per model version and threshold; every query below is served from the cube
+@st.cache_data(show_spinner="Scoring cohort and building risk cube...")
+def load_cube(version: str, threshold: float, _model, _df):
+    return build_risk_cube(_model, _df, threshold=threshold)
+
+
+version = model_version(model)
+threshold = st.session_state.get("threshold", 0.5)
+cube = load_cube(version, threshold, model, df)
+st.sidebar.success(f"✅ Risk cube ready for model {version} (threshold {threshold:.2f})")
+
+# ---------------- Slice & Dice ----------------
+group_by = st.sidebar.multiselect("Group by", CUBE_DIMENSIONS, default=["Degree"])
+filters = {}
+with st.sidebar.expander("Filters"):
+    for dim in CUBE_DIMENSIONS:
+        filters[dim] = st.multiselect(dim, sorted(cube[(dim,)][dim].unique()))
+
+start = time.perf_counter()
+result = query_cube(cube, group_by, filters)
+elapsed_ms = (time.perf_counter() - start) * 1000
+
+st.markdown('<div class="section-header"><h2>📊 Cohort Risk</h2></div>', unsafe_allow_html=True)
+st.caption(f"Answered from the precomputed cube in {elapsed_ms:.1f} ms")
+
+if result["Students"].sum() == 0:
+    st.info("No students match the selected filters.")
+    st.stop()
+
+if group_by:
+    label = result[group_by].astype(str).agg(" / ".join, axis=1)
+    fig = px.bar(result.assign(Cohort=label).head(30), x="Cohort", y="Mean Probability",
+                 hover_data=["Students", "Predicted Positive Rate"],
+                 title="Mean predicted depression probability (top 30 cohorts)")
+    st.plotly_chart(fig, use_container_width=True)
+
+st.dataframe(result, use_container_width=True)
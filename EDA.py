@@ -4,6 +4,10 @@ import pandas as pd
 import plotly.express as px
 from pathlib import Path
 
+from approx_stats import summarize, summarize_csv
+from data_store import file_version
+from figure_cache import FigureCache
+
 st.set_page_config(page_title="EDA - Student Depression", layout="wide")
 
 # ---------- Page Background ----------
@@ -56,15 +60,41 @@ csv_path = find_csv("student_depression_dataset.csv")
 df = None
 if csv_path:
     df = load_data(csv_path)
+    dataset_version = file_version(csv_path)
 else:
     uploaded = st.sidebar.file_uploader("Upload CSV", type=["csv"])
     if uploaded:
         df = pd.read_csv(uploaded)
+        dataset_version = ("upload", uploaded.file_id, uploaded.size)
 
 if df is None:
     st.warning("No dataset found. Place student_depression_dataset.csv in your project or upload it.")
     st.stop()
 
+# ---------- Approximate statistics ----------
+# Sketches are built per chunk and merged once per dataset, streaming from the file when there is one
+# (uploads are summarized in memory); see approx_stats for error bounds
+@st.cache_data(show_spinner="Building approximate summaries...")
+def approximate_summary(version, path, _df):
+    return summarize_csv(path) if path else summarize(_df)
+
+approximate = st.sidebar.checkbox("Approximate statistics (large data)", value=len(df) > 1_000_000,
+                                  help="Quantiles within ~1% rank error, top counts within n/101, "
+                                       "distinct counts within ~1.6%. Count, mean, std, min and max stay exact.")
+summary = approximate_summary(dataset_version, csv_path, df) if approximate else None
+
+# ---------- Figure cache (shared across sessions) ----------
+FIGURE_CACHE_MB = 256
+
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache(max_bytes=FIGURE_CACHE_MB * 1024 * 1024)
+
+figure_cache = get_figure_cache()
+
+def cached_figure(selection, build):
+    return figure_cache.get_or_build((dataset_version,) + selection, build)
+
 # ---------- Column identification ----------
 numeric_cols = df.select_dtypes(include=["int64", "float64"]).columns.tolist()
 categorical_cols = df.select_dtypes(include=["object", "category"]).columns.tolist()
@@ -80,13 +110,16 @@ if section == "Univariate Analysis":
     st.markdown('<div class="section-header"><h2>📈 Univariate Analysis</h2></div>', unsafe_allow_html=True)
     col = st.selectbox("Select column", df.columns)
     if col in numeric_cols:
-        fig = px.histogram(df, x=col, marginal="box", nbins=30, title=f"Distribution of {col}")
+        fig = cached_figure(("histogram", col),
+                            lambda: px.histogram(df, x=col, marginal="box", nbins=30, title=f"Distribution of {col}"))
         st.plotly_chart(fig, use_container_width=True)
-        st.write(df[col].describe())
+        st.write(summary[col].describe() if approximate else df[col].describe())
     else:
-        vc = df[col].value_counts().reset_index()
+        vc = summary[col].value_counts() if approximate else df[col].value_counts()
+        vc = vc.reset_index()
         vc.columns = [col, "count"]
-        fig = px.bar(vc, x=col, y="count", title=f"Counts of {col}")
+        fig = cached_figure(("bar", col, approximate),
+                            lambda: px.bar(vc, x=col, y="count", title=f"Counts of {col}"))
         st.plotly_chart(fig, use_container_width=True)
         st.dataframe(vc)
 
@@ -97,9 +130,10 @@ elif section == "Bivariate Analysis":
         x_col = st.selectbox("X (numeric)", numeric_cols, index=0)
         y_col = st.selectbox("Y (numeric)", numeric_cols, index=1 if len(numeric_cols) > 1 else 0)
         color_col = st.selectbox("Optional color (categorical)", [None] + categorical_cols)
-        fig = px.scatter(df, x=x_col, y=y_col, 
-                         color=color_col if color_col else None,
-                         trendline="ols", title=f"{y_col} vs {x_col}")
+        fig = cached_figure(("scatter", x_col, y_col, color_col),
+                            lambda: px.scatter(df, x=x_col, y=y_col, 
+                                               color=color_col if color_col else None,
+                                               trendline="ols", title=f"{y_col} vs {x_col}"))
         st.plotly_chart(fig, use_container_width=True)
         st.write("Correlation:", df[[x_col, y_col]].corr().iloc[0,1].round(3))
     else:
@@ -111,11 +145,20 @@ elif section == "Multivariate Analysis":
     cols = st.multiselect("Select numeric columns", numeric_cols, default=numeric_cols[:4])
     if len(cols) >= 2:
         st.markdown("**Scatter matrix**")
-        fig = px.scatter_matrix(df, dimensions=cols, title="Scatter matrix")
+        fig = cached_figure(("scatter_matrix", tuple(cols)),
+                            lambda: px.scatter_matrix(df, dimensions=cols, title="Scatter matrix"))
         st.plotly_chart(fig, use_container_width=True)
         st.markdown("**Correlation heatmap**")
-        corr = df[cols].corr()
-        fig2 = px.imshow(corr, text_auto=True, title="Correlation heatmap")
+        fig2 = cached_figure(("heatmap", tuple(cols)),
+                             lambda: px.imshow(df[cols].corr(), text_auto=True, title="Correlation heatmap"))
         st.plotly_chart(fig2, use_container_width=True)
     else:
         st.info("Select at least 2 numeric columns for multivariate analysis.")
+
+# ---------- Figure cache metrics ----------
+stats = figure_cache.stats()
+st.sidebar.caption(
+    f"Figure cache: {stats['hit_rate']:.0%} hit rate ({stats['hits']}/{stats['hits'] + stats['misses']}), "
+    f"{stats['entries']} figures, {stats['bytes'] / 2**20:.1f}/{stats['max_bytes'] / 2**20:.0f} MB, "
+    f"{stats['evictions']} evictions"
+)
@@ -1,6 +1,7 @@
 # ==============================
 # Student Depression Prediction App
 # ==============================
+import numpy as np
 import pandas as pd
 import streamlit as st
 from sklearn.model_selection import train_test_split
@@ -11,6 +12,11 @@ from sklearn.impute import SimpleImputer
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import f1_score
 
+from explain import LinearExplainer
+from model_store import model_version
+from similar_students import load_or_build
+from training_pipeline import solver_settings
+
 # ---------------- Streamlit Page Config ----------------
 st.set_page_config(
     page_title="Student Depression Predictor",
@@ -37,6 +43,10 @@ st.markdown("""
 """, unsafe_allow_html=True)
 st.markdown("---")
 
+# ---------------- Precision Mode ----------------
+float32_mode = st.sidebar.checkbox("Float32 mode", help="Preprocess, train and score in float32")
+dtype = np.float32 if float32_mode else np.float64
+
 # ---------------- Load Dataset ----------------
 df = pd.read_csv("student_depression_dataset.csv")
 
@@ -50,7 +60,7 @@ categorical_features = ["Gender", "Degree", "Profession",
                         "Have you ever had suicidal thoughts ?",
                         "Family History of Mental Illness"]
 
-df[numeric_features] = df[numeric_features].apply(pd.to_numeric, errors='coerce')
+df[numeric_features] = df[numeric_features].apply(pd.to_numeric, errors='coerce').astype(dtype)
 df[categorical_features] = df[categorical_features].astype(str)
 
 X = df[numeric_features + categorical_features]
@@ -69,7 +79,7 @@ numeric_transformer = Pipeline(steps=[
 
 categorical_transformer = Pipeline(steps=[
     ('imputer', SimpleImputer(strategy='constant', fill_value='missing')),
-    ('onehot', OneHotEncoder(handle_unknown='ignore', sparse_output=False))
+    ('onehot', OneHotEncoder(handle_unknown='ignore', sparse_output=False, dtype=dtype))
 ])
 
 ct = ColumnTransformer(
@@ -85,12 +95,22 @@ X_test_transformed = ct.transform(X_test)
 # ---------------- Train Model ----------------
 lr = LogisticRegression(
     penalty="l2",
-    solver="liblinear",
     C=0.03,
     random_state=42,
-    class_weight="balanced"
+    class_weight="balanced",
+    **solver_settings(dtype)
 )
 lr.fit(X_train_transformed, y_train)
+explainer = LinearExplainer(ct, lr)
+
+
+# Built once per model version and persisted next to it
+@st.cache_resource(show_spinner="Building similar-students index...")
+def get_neighbour_index(version, _X_train_transformed, _y_train):
+    return load_or_build(_X_train_transformed, _y_train, version, labels=_y_train.index)
+
+
+neighbours = get_neighbour_index(model_version((ct, lr)), X_train_transformed, y_train)
 
 # ---------------- Evaluate Model ----------------
 y_pred = lr.predict(X_test_transformed)
@@ -143,7 +163,7 @@ if st.button("Predict Depression"):
         "Family History of Mental Illness": family_history
     }])
 
-    query_point[numeric_features] = query_point[numeric_features].astype(float)
+    query_point[numeric_features] = query_point[numeric_features].astype(dtype)
     query_point[categorical_features] = query_point[categorical_features].astype(str)
     query_transformed = ct.transform(query_point)
 
@@ -188,6 +208,28 @@ if st.button("Predict Depression"):
         </div>
         """, unsafe_allow_html=True)
 
+    # ---------------- Key Factors ----------------
+    st.markdown("---")
+    st.header("🔍Key Factors Behind This Prediction")
+
+    drivers = explainer.top_drivers(query_transformed, k=3, transformed=True).iloc[0]
+    factors = pd.DataFrame([{
+        "Factor": drivers[f"feature_{rank}"],
+        "Value": str(query_point.iloc[0][drivers[f"feature_{rank}"]]),
+        "Effect": "Raises risk" if drivers[f"contribution_{rank}"] > 0 else "Lowers risk",
+        "Contribution": round(float(drivers[f"contribution_{rank}"]), 3)
+    } for rank in range(1, 4)])
+    st.dataframe(factors, use_container_width=True, hide_index=True)
+
+    # ---------------- Similar Students ----------------
+    st.markdown("---")
+    st.header("👥Similar Past Students")
+
+    labels, distances, rates = neighbours.query(query_transformed, k=10)
+    st.metric("Depression rate among the 10 most similar students", f"{rates[0] * 100:.0f}%")
+    similar = df.loc[labels[0], numeric_features + categorical_features + ["Depression"]]
+    st.dataframe(similar.assign(Distance=distances[0].round(3)), use_container_width=True)
+
     # ---------------- Recommendations ----------------
     st.markdown("---")
     st.header("💡Personalized Recommendations")
@@ -0,0 +1,197 @@
+# ==============================
+# Dependency-free compact model format
+# ==============================
+# The exporter reads fitted sklearn attributes by duck typing and the loader scores
+# with NumPy only, so serving never has to import sklearn (or pandas).
+import json
+
+import numpy as np
+
+FORMAT_NAME = "student-depression-compact"
+FORMAT_VERSION = 1
+
+
+# ---------------- Export ----------------
+def _step(steps, attribute):
+    return next((step for _, step in steps if hasattr(step, attribute)), None)
+
+
+def export_compact(preprocessor, classifier, threshold=0.5, model_version=None):
+    """Describe a fitted ColumnTransformer + binary linear classifier as plain JSON data."""
+    blocks = []
+    for name, transformer, columns in preprocessor.transformers_:
+        if transformer == "drop":
+            continue
+        steps = transformer.steps if hasattr(transformer, "steps") else [(name, transformer)]
+        known = {"statistics_", "mean_", "scale_", "categories_"}
+        unknown = [n for n, s in steps if not any(hasattr(s, a) for a in known)]
+        if unknown:
+            raise ValueError(f"Cannot export transformer step(s) {unknown} in '{name}'")
+
+        imputer = _step(steps, "statistics_")
+        fill = imputer.statistics_.tolist() if imputer is not None else None
+        encoder = _step(steps, "categories_")
+        if encoder is not None:
+            blocks.append({
+                "kind": "categorical",
+                "columns": list(columns),
+                "fill": [str(v) for v in fill] if fill is not None else None,
+                "vocabularies": [[str(v) for v in cats] for cats in encoder.categories_],
+            })
+        else:
+            scaler = _step(steps, "scale_")
+            mean = getattr(scaler, "mean_", None)
+            scale = getattr(scaler, "scale_", None)
+            blocks.append({
+                "kind": "numeric",
+                "columns": list(columns),
+                "fill": fill,
+                "mean": mean.tolist() if mean is not None else None,
+                "scale": scale.tolist() if scale is not None else None,
+            })
+
+    return {
+        "format": FORMAT_NAME,
+        "format_version": FORMAT_VERSION,
+        "model_version": model_version,
+        "threshold": float(threshold),
+        "blocks": blocks,
+        "coef": np.asarray(classifier.coef_, dtype=float).ravel().tolist(),
+        "intercept": float(np.asarray(classifier.intercept_).ravel()[0]),
+    }
+
+
+def export_pipeline(model, threshold=0.5, model_version=None):
+    return export_compact(model.named_steps["preprocessor"], model.named_steps["classifier"],
+                          threshold=threshold, model_version=model_version)
+
+
+def save_compact(spec, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(spec, f, separators=(",", ":"))
+
+
+# ---------------- Load & Score ----------------
+def _column(data, name):
+    if isinstance(data, (list, tuple)):
+        return np.array([row.get(name) for row in data], dtype=object)
+    return np.array(data[name], dtype=object)
+
+
+def _is_nan(values):
+    return np.fromiter((isinstance(v, float) and v != v for v in values), dtype=bool, count=len(values))
+
+
+def _is_missing(values):
+    return np.fromiter((v is None or (isinstance(v, float) and v != v) for v in values),
+                       dtype=bool, count=len(values))
+
+
+def _numeric_column(data, name):
+    values = _column(data, name)
+    values[_is_missing(values)] = np.nan
+    return values.astype(float)
+
+
+class CompactModel:
+    """Score records from an exported spec with plain NumPy.
+
+    ``data`` may be a DataFrame, a dict of column arrays or a list of row dicts.
+    Rather than materializing one-hot columns, each category maps straight to its
+    coefficient, so scoring costs one lookup per categorical column.
+
+    Missing values follow the sklearn pipeline: None and NaN are imputed in
+    numeric columns, but in categorical columns only NaN is (SimpleImputer
+    matches ``missing_values=np.nan``); None scores as an unknown category.
+    """
+
+    def __init__(self, spec):
+        if spec.get("format") != FORMAT_NAME:
+            raise ValueError("Not a compact student-depression model")
+        if spec.get("format_version", 0) > FORMAT_VERSION:
+            raise ValueError(f"Unsupported compact model version {spec['format_version']}")
+        self.spec = spec
+        self.threshold = spec["threshold"]
+        self.model_version = spec.get("model_version")
+        self.intercept = spec["intercept"]
+        coef = np.asarray(spec["coef"], dtype=float)
+
+        self._numeric = []
+        self._categorical = []
+        offset = 0
+        for block in spec["blocks"]:
+            if block["kind"] == "numeric":
+                n = len(block["columns"])
+                mean = np.asarray(block["mean"] if block["mean"] is not None else np.zeros(n), dtype=float)
+                scale = np.asarray(block["scale"] if block["scale"] is not None else np.ones(n), dtype=float)
+                fill = np.asarray(block["fill"], dtype=float) if block["fill"] is not None else None
+                self._numeric.append((block["columns"], fill, mean, scale, coef[offset:offset + n]))
+                offset += n
+            else:
+                for i, (col, vocab) in enumerate(zip(block["columns"], block["vocabularies"])):
+                    vocab = np.asarray(vocab, dtype=str)
+                    weights = coef[offset:offset + len(vocab)]
+                    order = np.argsort(vocab)
+                    fill = block["fill"][i] if block["fill"] is not None else None
+                    self._categorical.append((col, fill, vocab[order], weights[order]))
+                    offset += len(vocab)
+        if offset != coef.shape[0]:
+            raise ValueError(f"Spec describes {offset} columns but has {coef.shape[0]} coefficients")
+
+    @property
+    def feature_names(self):
+        return [c for cols, *_ in self._numeric for c in cols] + [c for c, *_ in self._categorical]
+
+    def decision_function(self, data):
+        logit = None
+        for columns, fill, mean, scale, weights in self._numeric:
+            X = np.column_stack([_numeric_column(data, c) for c in columns])
+            if fill is not None:
+                X = np.where(np.isnan(X), fill, X)
+            part = ((X - mean) / scale) @ weights
+            logit = part if logit is None else logit + part
+
+        for col, fill, vocab, weights in self._categorical:
+            raw = _column(data, col)
+            if fill is not None:
+                raw = np.where(_is_nan(raw), fill, raw)
+            values = raw.astype(str)
+            idx = np.searchsorted(vocab, values)
+            idx_clipped = np.minimum(idx, len(vocab) - 1)
+            known = vocab[idx_clipped] == values
+            # Unknown categories encode as all-zeros, like handle_unknown="ignore"
+            part = np.where(known, weights[idx_clipped], 0.0)
+            logit = part if logit is None else logit + part
+
+        return logit + self.intercept
+
+    def predict_proba(self, data):
+        p = 1.0 / (1.0 + np.exp(-self.decision_function(data)))
+        return np.column_stack([1.0 - p, p])
+
+    def predict(self, data):
+        return (self.predict_proba(data)[:, 1] >= self.threshold).astype(int)
+
+
+def load_compact(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return CompactModel(json.load(f))
+
+
+# ---------------- Parity ----------------
+def parity_gap(model, compact, X):
+    """Largest probability difference between the fitted pipeline and the compact model.
+
+    Besides ``X`` itself, every column is blanked in turn: numeric columns with
+    NaN, categorical columns with NaN and with None.
+    """
+    numeric = {c for cols, *_ in compact._numeric for c in cols}
+    probes = [X]
+    for col in compact.feature_names:
+        blanks = [np.nan] if col in numeric else [np.nan, None]
+        for blank in blanks:
+            probe = X.copy()
+            probe[col] = np.full(len(X), blank, dtype=float if blank is not None else object)
+            probes.append(probe)
+    return max(float(np.max(np.abs(model.predict_proba(probe)[:, 1] - compact.predict_proba(probe)[:, 1])))
+               for probe in probes)
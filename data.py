@@ -1,6 +1,11 @@
+import os
+
 import streamlit as st
 import pandas as pd
 
+from approx_stats import summarize_csv
+from data_store import file_version
+
 st.set_page_config(page_title="Student Depression Data Info", layout="wide")
 
 # --- Page Background with Soft Purple Gradient + Global Table Styling ---
@@ -73,8 +78,16 @@ st.markdown(page_bg, unsafe_allow_html=True)
 st.markdown('<div class="main-heading">📂 Data & Feature Information</div>', unsafe_allow_html=True)
 
 # --- Load Dataset ---
-df = pd.read_csv("student_depression_dataset.csv")
-st.session_state["data"] = df
+csv_path = "student_depression_dataset.csv"
+stream = st.sidebar.checkbox("Stream statistics from file (large data)",
+                             value=os.path.getsize(csv_path) > 100_000_000,
+                             help="Reads the CSV in chunks so the full table is never held in memory. "
+                                  "Counts, mean, min and max are exact.")
+if stream:
+    df = pd.read_csv(csv_path, nrows=5)   # preview only
+else:
+    df = pd.read_csv(csv_path)
+    st.session_state["data"] = df
 
 # --- Section: Preview of Dataset ---
 st.markdown('<div class="section-heading">🔎 Preview of Dataset</div>', unsafe_allow_html=True)
@@ -102,14 +115,25 @@ feature_explanations = {
     "Depression": "Target variable (1 = Depressed, 0 = Not Depressed)."
 }
 
+# --- Streamed Summaries (exact moments merged chunk by chunk, no sketches) ---
+@st.cache_data(show_spinner="Summarizing dataset...")
+def dataset_summary(version, path):
+    return summarize_csv(path, sketches=False)
+
+summary = dataset_summary(file_version(csv_path), csv_path) if stream else None
+
 # --- Build Dataset Info Table ---
 info_data = []
 for col in df.columns:
-    dtype = str(df[col].dtype)
-    non_nulls = df[col].notnull().sum()
+    dtype = summary[col].dtype if stream else str(df[col].dtype)
+    non_nulls = summary[col].count if stream else df[col].notnull().sum()
     explanation = feature_explanations.get(col, "No explanation available.")
     
-    if pd.api.types.is_numeric_dtype(df[col]):
+    if stream and summary[col].numeric:
+        mean_val = round(summary[col].mean, 2)
+        min_val = round(summary[col].min, 2)
+        max_val = round(summary[col].max, 2)
+    elif not stream and pd.api.types.is_numeric_dtype(df[col]):
         mean_val = round(df[col].mean(), 2)
         min_val = round(df[col].min(), 2)
         max_val = round(df[col].max(), 2)
@@ -0,0 +1,10 @@
+# ==============================
+# Dataset identity shared by the cached analytics
+# ==============================
+import os
+
+
+def file_version(path):
+    """Cheap dataset version for a file on disk: path, size and modification time."""
+    stat = os.stat(path)
+    return (str(path), stat.st_size, stat.st_mtime_ns)
@@ -0,0 +1,235 @@
+# ==============================
+# Streaming input-drift monitor
+# ==============================
+import argparse
+import threading
+
+import numpy as np
+import pandas as pd
+
+NUMERIC_FEATURES = ["Age", "CGPA", "Academic Pressure", "Study Satisfaction",
+                    "Job Satisfaction", "Work/Study Hours", "Work Pressure",
+                    "Financial Stress"]
+
+CATEGORICAL_FEATURES = ["Gender", "Degree", "Profession",
+                        "Dietary Habits", "Sleep Duration",
+                        "Have you ever had suicidal thoughts ?",
+                        "Family History of Mental Illness"]
+
+# Usual PSI reading: < 0.1 stable, 0.1–0.25 moderate shift, > 0.25 significant shift
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+# A feature is judged only after max(MIN_RECORDS, RECORDS_PER_BIN * bins) records;
+# with fewer, sampling noise alone pushes PSI over the thresholds
+MIN_RECORDS = 100
+RECORDS_PER_BIN = 20
+MAX_DISCRETE_VALUES = 20
+_EPS = 1e-4
+
+
+def build_reference(df, numeric=NUMERIC_FEATURES, categorical=CATEGORICAL_FEATURES, n_bins=10):
+    """Reference profile: bin layout and expected bin shares per numeric feature,
+    expected category shares per categorical feature.
+
+    Numeric features with at most ``MAX_DISCRETE_VALUES`` distinct values (the
+    1–5 rating scales) get one bin per reference value plus a bin for values
+    never seen; quantile edges would collapse on them when one value dominates.
+    Other numeric features get quantile bins plus underflow and overflow bins
+    outside the reference min/max.
+    """
+    profile = {}
+    for col in numeric:
+        values = pd.to_numeric(df[col], errors="coerce").dropna().to_numpy()
+        distinct = np.unique(values)
+        if len(distinct) <= MAX_DISCRETE_VALUES:
+            spec = {"kind": "numeric", "values": distinct.tolist()}
+        else:
+            edges = np.unique(np.quantile(values, np.linspace(0, 1, n_bins + 1)[1:-1]))
+            spec = {"kind": "numeric", "edges": edges.tolist(),
+                    "min": float(distinct[0]), "max": float(distinct[-1])}
+        counts = np.bincount(_numeric_bins(spec, values), minlength=_numeric_bin_count(spec))
+        spec["expected"] = counts / counts.sum()
+        profile[col] = spec
+    for col in categorical:
+        shares = df[col].astype(str).value_counts(normalize=True)
+        # Last slot is the bucket for categories never seen in the reference data
+        profile[col] = {"kind": "categorical", "categories": shares.index.tolist(),
+                        "expected": np.append(shares.to_numpy(), 0.0)}
+    return profile
+
+
+def _numeric_bin_count(spec):
+    if "values" in spec:
+        return len(spec["values"]) + 1
+    return len(spec["edges"]) + 3
+
+
+def _numeric_bins(spec, values):
+    """Bin index of each (non-missing) value under a numeric reference spec."""
+    values = np.asarray(values, dtype=float)
+    if "values" in spec:
+        known = np.asarray(spec["values"], dtype=float)
+        pos = np.minimum(np.searchsorted(known, values), len(known) - 1)
+        # Last slot is the bucket for values never seen in the reference data
+        return np.where(known[pos] == values, pos, len(known))
+    bins = np.searchsorted(spec["edges"], values, side="right") + 1
+    bins[values < spec["min"]] = 0
+    bins[values > spec["max"]] = len(spec["edges"]) + 2
+    return bins
+
+
+def psi(expected, actual):
+    e = np.clip(expected, _EPS, None)
+    a = np.clip(actual, _EPS, None)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def _reference_bins(expected):
+    return int(np.count_nonzero(np.asarray(expected) > 0))
+
+
+class _NumericSketch:
+    """Fixed-size histogram over the reference bins."""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.counts = np.zeros(_numeric_bin_count(spec), dtype=np.int64)
+        self.missing = 0
+
+    def update(self, value):
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            value = float("nan")
+        if value != value:
+            self.missing += 1
+        else:
+            self.counts[_numeric_bins(self.spec, [value])[0]] += 1
+
+    def update_many(self, values):
+        values = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy()
+        present = values[~np.isnan(values)]
+        self.missing += len(values) - len(present)
+        self.counts += np.bincount(_numeric_bins(self.spec, present), minlength=len(self.counts))
+
+
+class _CategoricalSketch:
+    """Counter bounded to the reference vocabulary plus one unseen bucket."""
+
+    def __init__(self, categories):
+        self.index = {c: i for i, c in enumerate(categories)}
+        self.counts = np.zeros(len(categories) + 1, dtype=np.int64)
+        self.missing = 0
+
+    def update(self, value):
+        self.counts[self.index.get(str(value), len(self.index))] += 1
+
+    def update_many(self, values):
+        bins = pd.Series(values).astype(str).map(self.index).fillna(len(self.index)).astype(int)
+        self.counts += np.bincount(bins.to_numpy(), minlength=len(self.counts))
+
+
+class DriftMonitor:
+    """Compare scored records against a reference profile as they arrive.
+
+    Each feature keeps a fixed number of counters, so memory does not grow with
+    the number of records; PSI and a binned KS statistic are recomputed from
+    those counters on demand at O(bins) cost.
+
+    Plug-in PSI over k bins reads about (k - 1) / n even when nothing has
+    shifted, so the reported PSI has that expected bias subtracted, and a
+    feature stays "warming up" until it has enough records for its bin count.
+    """
+
+    def __init__(self, reference):
+        self.reference = reference
+        self.records = 0
+        self._lock = threading.Lock()
+        self._sketches = {
+            col: _NumericSketch(spec) if spec["kind"] == "numeric"
+            else _CategoricalSketch(spec["categories"])
+            for col, spec in reference.items()
+        }
+
+    def update(self, record):
+        with self._lock:
+            self.records += 1
+            for col, sketch in self._sketches.items():
+                sketch.update(record.get(col))
+
+    def update_batch(self, df):
+        with self._lock:
+            self.records += len(df)
+            for col, sketch in self._sketches.items():
+                sketch.update_many(df[col])
+
+    def feature_report(self):
+        rows = []
+        with self._lock:
+            for col, sketch in self._sketches.items():
+                spec = self.reference[col]
+                observed = int(sketch.counts.sum())
+                row = {"Feature": col, "Kind": spec["kind"], "Observed": observed,
+                       "Missing": sketch.missing, "PSI": np.nan, "KS": np.nan}
+                bins = _reference_bins(spec["expected"])
+                if observed:
+                    actual = sketch.counts / observed
+                    row["PSI"] = max(psi(spec["expected"], actual) - (bins - 1) / observed, 0.0)
+                    if spec["kind"] == "numeric":
+                        row["KS"] = float(np.max(np.abs(np.cumsum(actual) - np.cumsum(spec["expected"]))))
+                row["Status"] = _level(row["PSI"], observed, bins)
+                rows.append(row)
+        return pd.DataFrame(rows)
+
+    def status(self):
+        """Overall status: the worst feature level and which features drifted."""
+        report = self.feature_report()
+        order = ["warming up", "stable", "moderate", "significant"]
+        worst = max(report["Status"], key=order.index) if len(report) else "warming up"
+        drifted = report.loc[report["Status"].isin(["moderate", "significant"]), "Feature"].tolist()
+        return {"records": self.records, "status": worst, "drifted": drifted}
+
+
+def _level(value, observed, bins):
+    if observed < max(MIN_RECORDS, RECORDS_PER_BIN * bins) or value != value:
+        return "warming up"
+    if value >= PSI_SIGNIFICANT:
+        return "significant"
+    if value >= PSI_MODERATE:
+        return "moderate"
+    return "stable"
+
+
+# ---------------- False-Alarm Check ----------------
+#   python drift.py --sizes 30 100 200 500 --trials 40
+def false_alarm_rates(df, sizes, trials=40, seed=0):
+    """Share of unshifted samples of each size (drawn from the reference data
+    itself) that the monitor reports as anything other than stable."""
+    reference = build_reference(df)
+    rates = {}
+    for size in sizes:
+        alarms = 0
+        for trial in range(trials):
+            monitor = DriftMonitor(reference)
+            monitor.update_batch(df.sample(size, random_state=seed + trial))
+            alarms += monitor.status()["status"] in ("moderate", "significant")
+        rates[size] = alarms / trials
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drift-monitor false-alarm check on unshifted samples")
+    parser.add_argument("--csv", default="student_depression_dataset.csv")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[30, 50, 100, 200, 500])
+    parser.add_argument("--trials", type=int, default=40)
+    args = parser.parse_args()
+
+    rates = false_alarm_rates(pd.read_csv(args.csv), args.sizes, args.trials)
+    for size, rate in rates.items():
+        print(f"records={size:<6} false alarms={rate:.0%}")
+    if any(rates.values()):
+        raise SystemExit("Unshifted samples were reported as drifted")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# ==============================
+# Threshold and calibration evaluation
+# ==============================
+import numpy as np
+import pandas as pd
+
+
+def threshold_sweep(y_true, proba):
+    """Confusion counts, precision, recall and F1 at every distinct threshold.
+
+    A student is flagged when ``proba >= threshold``. One descending sort plus a
+    cumulative sum of positives gives the counts for all cut-offs at once; rows
+    are ordered from the strictest threshold to the loosest.
+    """
+    y = np.asarray(y_true).astype(int)
+    p = np.asarray(proba, dtype=float)
+    order = np.argsort(-p, kind="mergesort")
+    p, y = p[order], y[order]
+
+    # Last position of each run of equal scores: everything up to it is flagged
+    last = np.r_[np.flatnonzero(np.diff(p)), len(p) - 1]
+    tp = np.cumsum(y)[last]
+    fp = last + 1 - tp
+    positives = y.sum()
+    fn = positives - tp
+    tn = len(y) - positives - fp
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(tp + fp > 0, tp / (tp + fp), 1.0)
+        recall = tp / positives if positives else np.zeros(len(tp))
+        f1 = np.where(2 * tp + fp + fn > 0, 2 * tp / (2 * tp + fp + fn), 0.0)
+
+    return pd.DataFrame({
+        "threshold": p[last], "tp": tp, "fp": fp, "tn": tn, "fn": fn,
+        "precision": precision, "recall": recall, "f1": f1,
+    })
+
+
+def choose_threshold(sweep, target_recall):
+    """Strictest threshold whose recall still meets ``target_recall``."""
+    meets = sweep[sweep["recall"] >= target_recall]
+    if meets.empty:
+        return sweep.iloc[-1]
+    return meets.iloc[0]
+
+
+def calibration_table(y_true, proba, n_bins=10):
+    """Reliability table: mean predicted probability vs observed rate per probability bin."""
+    y = np.asarray(y_true).astype(float)
+    p = np.asarray(proba, dtype=float)
+    bins = np.minimum((p * n_bins).astype(int), n_bins - 1)
+    count = np.bincount(bins, minlength=n_bins)
+    predicted = np.bincount(bins, weights=p, minlength=n_bins)
+    observed = np.bincount(bins, weights=y, minlength=n_bins)
+
+    table = pd.DataFrame({
+        "bin": [f"{i / n_bins:.1f}–{(i + 1) / n_bins:.1f}" for i in range(n_bins)],
+        "count": count, "mean_predicted": predicted, "observed_rate": observed,
+    })
+    table = table[table["count"] > 0].reset_index(drop=True)
+    table["mean_predicted"] /= table["count"]
+    table["observed_rate"] /= table["count"]
+    table["gap"] = table["observed_rate"] - table["mean_predicted"]
+    return table
+
+
+def expected_calibration_error(calibration):
+    weights = calibration["count"] / calibration["count"].sum()
+    return float((weights * calibration["gap"].abs()).sum())
@@ -0,0 +1,82 @@
+# ==============================
+# Per-feature contribution explanations for the linear model
+# ==============================
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+def _output_owners(preprocessor):
+    """Original input column for every column the ColumnTransformer emits."""
+    input_names = list(getattr(preprocessor, "feature_names_in_", []))
+    owners = []
+    for name, transformer, columns in preprocessor.transformers_:
+        if transformer == "drop":
+            continue
+        columns = [input_names[c] if isinstance(c, (int, np.integer)) else c for c in columns]
+        steps = transformer.steps if hasattr(transformer, "steps") else [(name, transformer)]
+        encoder = next((step for _, step in steps if hasattr(step, "categories_")), None)
+        if encoder is not None:
+            for col, categories in zip(columns, encoder.categories_):
+                owners.extend([col] * len(categories))
+        else:
+            owners.extend(columns)
+    return owners
+
+
+class LinearExplainer:
+    """Explain a fitted ColumnTransformer + linear classifier in whole batches.
+
+    The contribution of an original column is the sum of coefficient × transformed
+    value over the output columns it produced (one for numeric, one per category
+    for one-hot). Contributions plus ``intercept`` add up to the model's logit.
+    """
+
+    def __init__(self, preprocessor, classifier):
+        self.preprocessor = preprocessor
+        self.classifier = classifier
+        owners = _output_owners(preprocessor)
+        coef = np.asarray(classifier.coef_).ravel()
+        if len(owners) != coef.shape[0]:
+            raise ValueError(
+                f"Preprocessor emits {len(owners)} columns but classifier has {coef.shape[0]} coefficients"
+            )
+        self.features = list(dict.fromkeys(owners))
+        position = {f: i for i, f in enumerate(self.features)}
+        # (n_transformed x n_original) 0/1 matrix that folds one-hot columns back together
+        mapping = np.zeros((len(owners), len(self.features)))
+        mapping[np.arange(len(owners)), [position[o] for o in owners]] = 1.0
+        self._weights = mapping * coef[:, None]
+        self.intercept = float(np.asarray(classifier.intercept_).ravel()[0])
+
+    @classmethod
+    def from_pipeline(cls, model, preprocessor_step="preprocessor", classifier_step="classifier"):
+        return cls(model.named_steps[preprocessor_step], model.named_steps[classifier_step])
+
+    def contributions(self, X, transformed=False):
+        """Signed logit contribution of every original feature, one row per student."""
+        Xt = X if transformed else self.preprocessor.transform(X)
+        if sparse.issparse(Xt):
+            values = np.asarray(Xt @ self._weights)
+        else:
+            values = np.asarray(Xt, dtype=float) @ self._weights
+        index = X.index if isinstance(X, pd.DataFrame) else None
+        return pd.DataFrame(values, columns=self.features, index=index)
+
+    def top_drivers(self, X, k=3, transformed=False):
+        """The k features with the largest absolute contribution for each student."""
+        contrib = self.contributions(X, transformed=transformed)
+        values = contrib.to_numpy()
+        k = min(k, values.shape[1])
+        magnitude = np.abs(values)
+        top = np.argpartition(-magnitude, k - 1, axis=1)[:, :k]
+        rows = np.arange(values.shape[0])[:, None]
+        order = np.argsort(-magnitude[rows, top], axis=1)
+        top = top[rows, order]
+
+        names = np.asarray(self.features, dtype=object)[top]
+        out = {}
+        for rank in range(k):
+            out[f"feature_{rank + 1}"] = names[:, rank]
+            out[f"contribution_{rank + 1}"] = values[rows[:, 0], top[:, rank]]
+        return pd.DataFrame(out, index=contrib.index)
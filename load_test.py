@@ -0,0 +1,195 @@
+# ==============================
+# Concurrent-session load test for the Streamlit pages
+# ==============================
+# Drives the real page scripts headlessly with streamlit.testing's AppTest. Like the
+# Streamlit server, every simulated session reruns its script on its own thread
+# inside one process, sharing st.cache_data / st.cache_resource.
+#
+# Rows run one after another in that process, so each row first does an unmeasured
+# warm-up session (with --cold, the caches are then cleared) and memory is reported as
+# the growth over the RSS at the start of the row rather than the process-wide peak.
+#
+#   python load_test.py --sessions 1 2 4 8 --iterations 3
+import argparse
+import gc
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = Path(__file__).resolve().parent
+SEEDED_KEYS = ["data", "X_train", "X_test", "y_train", "y_test", "features", "model"]
+
+
+# ---------------- Scripted Interactions ----------------
+def click(label):
+    def step(at):
+        next(b for b in at.button if b.label == label).click().run()
+    step.__name__ = f"click {label!r}"
+    return step
+
+
+def choose(widget, label, value):
+    def step(at):
+        next(w for w in getattr(at, widget) if w.label == label).set_value(value).run()
+    step.__name__ = f"{label!r} = {value!r}"
+    return step
+
+
+SCENARIOS = {
+    "app.py": [],
+    "data.py": [],
+    "EDA.py": [
+        choose("radio", "Choose analysis:", "Bivariate Analysis"),
+        choose("radio", "Choose analysis:", "Multivariate Analysis"),
+    ],
+    "model training.py": [click("Split Data"), click("Train Model")],
+    "prediction.py": [click("Predict Depression")],
+    "Recommendation.py": [click("Predict Depression")],
+    "Cohort Analytics.py": [],
+}
+
+# Pages that read the trained model from session state get it seeded up front
+NEEDS_MODEL = {"prediction.py", "Cohort Analytics.py"}
+
+
+def trained_session_state(timeout):
+    at = AppTest.from_file(str(ROOT / "model training.py"), default_timeout=timeout).run()
+    click("Split Data")(at)
+    click("Train Model")(at)
+    return {key: at.session_state[key] for key in SEEDED_KEYS}
+
+
+# ---------------- Memory Sampling ----------------
+def _current_rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return float("nan")
+    # ru_maxrss is KB on Linux, bytes on macOS; it is a lifetime high-water mark
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+class PeakRSS:
+    """Sample resident memory in the background and keep the peak."""
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = np.fmax(self.peak, _current_rss_mb())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = np.fmax(self.peak, _current_rss_mb())
+
+
+# ---------------- Sessions ----------------
+def run_session(page, iterations, seed_state, timeout):
+    """One simulated user: load the page, then replay its interactions."""
+    latencies, errors = [], 0
+    for _ in range(iterations):
+        at = AppTest.from_file(str(ROOT / page), default_timeout=timeout)
+        for key, value in (seed_state or {}).items():
+            at.session_state[key] = value
+        for step in [lambda app: app.run()] + SCENARIOS[page]:
+            start = time.perf_counter()
+            try:
+                step(at)
+            except Exception:
+                errors += 1
+                break
+            latencies.append(time.perf_counter() - start)
+            errors += len(at.exception)
+    return latencies, errors
+
+
+def load_page(page, sessions, iterations, seed_state, timeout, cold=False):
+    # Unmeasured pass so every row starts with the page's modules imported and its caches warm
+    run_session(page, 1, seed_state, timeout)
+    if cold:
+        st.cache_data.clear()
+        st.cache_resource.clear()
+    gc.collect()
+    baseline = _current_rss_mb()
+
+    with PeakRSS() as rss, ThreadPoolExecutor(max_workers=sessions) as pool:
+        start = time.perf_counter()
+        results = list(pool.map(lambda _: run_session(page, iterations, seed_state, timeout), range(sessions)))
+        wall = time.perf_counter() - start
+
+    latencies = np.array([lat for lats, _ in results for lat in lats]) * 1000
+    return {
+        "page": page,
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "errors": sum(err for _, err in results),
+        "p50_ms": np.percentile(latencies, 50) if len(latencies) else np.nan,
+        "p95_ms": np.percentile(latencies, 95) if len(latencies) else np.nan,
+        "p99_ms": np.percentile(latencies, 99) if len(latencies) else np.nan,
+        "reruns_per_s": len(latencies) / wall,
+        "peak_rss_mb": rss.peak,
+        "rss_growth_mb": rss.peak - baseline,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the Streamlit pages")
+    parser.add_argument("--pages", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--sessions", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--iterations", type=int, default=3, help="page loads per session")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds allowed per rerun")
+    parser.add_argument("--cold", action="store_true",
+                        help="clear st.cache_data / st.cache_resource before each measured row")
+    parser.add_argument("--csv", help="also write the results table to this CSV file")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)  # the pages read the dataset relative to the working directory
+    seed_state = trained_session_state(args.timeout) if NEEDS_MODEL & set(args.pages) else None
+
+    rows = []
+    for page in args.pages:
+        for sessions in args.sessions:
+            row = load_page(page, sessions, args.iterations,
+                            seed_state if page in NEEDS_MODEL else None, args.timeout, args.cold)
+            rows.append(row)
+            print(f"{page:<20} sessions={sessions:<3} p95={row['p95_ms']:.0f}ms "
+                  f"throughput={row['reruns_per_s']:.2f}/s rss +{row['rss_growth_mb']:.0f}MB", flush=True)
+
+    report = pd.DataFrame(rows)
+    print()
+    print(report.to_string(index=False, float_format=lambda v: f"{v:.1f}"))
+    if args.csv:
+        report.to_csv(args.csv, index=False)
+
+
+if __name__ == "__main__":
+    main()
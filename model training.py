@@ -1,13 +1,23 @@
+import json
+import time
+
+import numpy as np
 import streamlit as st
 import pandas as pd
+import plotly.express as px
 from sklearn.model_selection import train_test_split
-from sklearn.pipeline import Pipeline
-from sklearn.compose import ColumnTransformer
-from sklearn.impute import SimpleImputer
-from sklearn.preprocessing import StandardScaler, OneHotEncoder
 from sklearn.linear_model import LogisticRegression
+from sklearn.svm import LinearSVC
+from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, f1_score
 
+from compact_model import CompactModel, export_pipeline, parity_gap
+from cross_validation import cross_validate_cached, summarize_folds
+from evaluation import calibration_table, choose_threshold, expected_calibration_error, threshold_sweep
+from model_store import model_version
+from precision_report import float32_parity_report
+from training_pipeline import make_classifier, make_model, make_preprocessor, to_float32
+
 # ---------------- PAGE CONFIG & BACKGROUND ----------------
 st.set_page_config(page_title="Student Depression ML Pipeline", layout="wide")
 
@@ -41,6 +51,23 @@ page_bg = """
 """
 st.markdown(page_bg, unsafe_allow_html=True)
 
+# ---------------- Precision Mode ----------------
+float32_mode = st.sidebar.checkbox(
+    "Float32 mode",
+    help="Load, transform, train and score in float32. Halves numeric memory; "
+         "see the parity report below for accuracy against float64."
+)
+dtype = np.float32 if float32_mode else np.float64
+
+# Classifiers offered for cross-validation; all share the cached fold transforms
+cv_classifiers = {
+    "Logistic Regression": lambda: make_classifier(dtype),
+    "Logistic Regression (balanced)": lambda: LogisticRegression(
+        penalty='l2', solver='liblinear', C=0.030733777087956198, class_weight="balanced"),
+    "Linear SVM": lambda: LinearSVC(C=0.01),
+    "Random Forest": lambda: RandomForestClassifier(n_estimators=200, n_jobs=1, random_state=42),
+}
+
 # ---------------- STEP 1: Train/Test Split ----------------
 st.markdown('<div class="heading-box train-test">Data Split</div>', unsafe_allow_html=True)
 
@@ -59,6 +86,8 @@ if df is None:
 columns_to_drop = ["id", "City", "Depression"]
 X = df.drop(columns=columns_to_drop, errors="ignore")
 y = df["Depression"]
+if float32_mode:
+    X = to_float32(X)
 
 features = X.columns.tolist()
 
@@ -86,31 +115,13 @@ if X_train is None or y_train is None:
     st.warning("Please complete Data Split first")
 else:
     if st.button("Train Model"):
-        numeric_features = X_train.select_dtypes(include=["int64", "float64"]).columns.tolist()
-        categorical_features = X_train.select_dtypes(include=["object"]).columns.tolist()
-
-        numeric_transformer = Pipeline([
-            ("imputer", SimpleImputer(strategy="mean")),
-            ("scaler", StandardScaler())
-        ])
-        categorical_transformer = Pipeline([
-            ("imputer", SimpleImputer(strategy="most_frequent")),
-            ("onehot", OneHotEncoder(handle_unknown="ignore"))
-        ])
-
-        preprocessor = ColumnTransformer([
-            ("num", numeric_transformer, numeric_features),
-            ("cat", categorical_transformer, categorical_features)
-        ])
-
-        lr = LogisticRegression(penalty='l2', solver='liblinear', C=0.030733777087956198)
-        model = Pipeline([
-            ("preprocessor", preprocessor),
-            ("classifier", lr)
-        ])
-
-        model.fit(X_train, y_train)
+        # The split may predate the precision toggle, so cast here as well
+        X_fit = to_float32(X_train) if float32_mode else X_train
+        model = make_model(X_fit, dtype)
+
+        model.fit(X_fit, y_train)
         st.session_state["model"] = model
+        st.session_state.pop("threshold", None)  # a new model needs its own cut-off
         st.success("Logistic Regression trained successfully")
 
         y_train_pred = model.predict(X_train)
@@ -139,3 +150,94 @@ if "train_acc" in st.session_state:
     # F1-Score
     col1.markdown(f"**<span style='color:{metric_color}'>Training F1-Score: {st.session_state['train_f1']:.3f}</span>**", unsafe_allow_html=True)
     col2.markdown(f"**<span style='color:{metric_color}'>Test F1-Score: {st.session_state['test_f1']:.3f}</span>**", unsafe_allow_html=True)
+
+# ---------------- Cross-Validation ----------------
+st.markdown('<div class="heading-box train-test">Cross-Validation</div>', unsafe_allow_html=True)
+st.caption("Stratified k-fold on the full dataset. Folds run in parallel and the transformed fold "
+           "matrices are cached on disk, so comparing classifiers does not refit the preprocessing.")
+
+cv_col1, cv_col2 = st.columns(2)
+cv_name = cv_col1.selectbox("Classifier", list(cv_classifiers))
+n_splits = cv_col2.slider("Folds", 3, 10, 5)
+
+if st.button("Run Cross-Validation"):
+    start = time.perf_counter()
+    folds = cross_validate_cached(make_preprocessor(X, dtype), cv_classifiers[cv_name](), X, y, n_splits=n_splits)
+    st.session_state["cv_result"] = (cv_name, folds, time.perf_counter() - start)
+
+if "cv_result" in st.session_state:
+    cv_name, folds, elapsed = st.session_state["cv_result"]
+    st.markdown(f"**{cv_name}** — {len(folds)} folds in {elapsed:.2f}s wall time")
+    st.dataframe(summarize_folds(folds), use_container_width=True)
+    st.markdown("**Per-fold metrics and timings**")
+    st.dataframe(folds, use_container_width=True)
+
+# ---------------- Decision Threshold ----------------
+@st.cache_data(show_spinner="Sweeping thresholds...")
+def evaluate_thresholds(version: str, _model, _X_test, _y_test):
+    proba = _model.predict_proba(_X_test)[:, 1]
+    return threshold_sweep(_y_test, proba), calibration_table(_y_test, proba)
+
+
+if "model" in st.session_state and X_test is not None:
+    st.markdown('<div class="heading-box logistic">Decision Threshold</div>', unsafe_allow_html=True)
+    sweep, calibration = evaluate_thresholds(model_version(st.session_state["model"]),
+                                             st.session_state["model"], X_test, y_test)
+
+    target_recall = st.slider("Target recall (share of depressed students flagged)", 0.50, 0.99, 0.90, 0.01)
+    chosen = choose_threshold(sweep, target_recall)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Threshold", f"{chosen['threshold']:.3f}")
+    col2.metric("Recall", f"{chosen['recall']:.3f}")
+    col3.metric("Precision", f"{chosen['precision']:.3f}")
+    col4.metric("F1-Score", f"{chosen['f1']:.3f}")
+    st.caption(f"TP {int(chosen['tp'])} · FP {int(chosen['fp'])} · TN {int(chosen['tn'])} · FN {int(chosen['fn'])}")
+
+    if st.button("Use this threshold for predictions"):
+        st.session_state["threshold"] = float(chosen["threshold"])
+    st.info(f"Serving threshold: {st.session_state.get('threshold', 0.5):.3f}")
+
+    fig = px.line(sweep, x="threshold", y=["precision", "recall", "f1"], title="Metrics by threshold")
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("**Calibration (reliability) table**")
+    st.caption(f"Expected calibration error: {expected_calibration_error(calibration):.3f}")
+    st.dataframe(calibration, use_container_width=True)
+
+# ---------------- Float32 Parity Report ----------------
+@st.cache_data(show_spinner="Training float64 and float32 pipelines...")
+def parity_report(scale: int, _X, _y):
+    return float32_parity_report(_X, _y, scale=scale)
+
+
+with st.expander("Float32 vs float64 parity report"):
+    scale = st.slider("Data size (copies of the dataset)", 1, 20, 10)
+    if st.button("Run parity report"):
+        st.session_state["parity_report"] = parity_report(scale, df.drop(columns=columns_to_drop, errors="ignore"), y)
+    if "parity_report" in st.session_state:
+        table, parity = st.session_state["parity_report"]
+        st.dataframe(table.T, use_container_width=True)
+        st.write(parity)
+
+# ---------------- Export Compact Model ----------------
+@st.cache_data(show_spinner="Checking compact model parity...")
+def compact_parity(version: str, _model, _X_test):
+    return parity_gap(_model, CompactModel(export_pipeline(_model)), _X_test.head(200))
+
+
+if "model" in st.session_state:
+    st.markdown('<div class="heading-box logistic">Export Compact Model</div>', unsafe_allow_html=True)
+    st.caption("Weights, scaler stats, imputer fill values and category vocabularies as versioned JSON, "
+               "loadable with compact_model.load_compact using only NumPy.")
+    model = st.session_state["model"]
+    version = model_version(model)
+    spec = export_pipeline(model, threshold=st.session_state.get("threshold", 0.5), model_version=version)
+    gap = compact_parity(version, model, st.session_state["X_test"])
+    st.caption(f"Max probability difference from the sklearn pipeline on 200 test rows, "
+               f"also with each column set to None / NaN: {gap:.1e}")
+    st.download_button(
+        "Download compact model",
+        data=json.dumps(spec, separators=(",", ":")),
+        file_name=f"student_depression_{version}.json",
+        mime="application/json"
+    )
@@ -0,0 +1,13 @@
+# ==============================
+# Model identity shared by the cached analytics
+# ==============================
+import hashlib
+import pickle
+from pathlib import Path
+
+MODEL_CACHE_DIR = Path(".model_cache")
+
+
+def model_version(model):
+    """Short content hash of a fitted model, used to key anything derived from it."""
+    return hashlib.sha256(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()[:12]
@@ -0,0 +1,110 @@
+# ==============================
+# Float32 vs float64 parity and performance report
+# ==============================
+#   python precision_report.py --scale 10
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+
+from training_pipeline import make_model, to_float32
+
+
+def _megabytes(X):
+    if sparse.issparse(X):
+        return (X.data.nbytes + X.indices.nbytes + X.indptr.nbytes) / 1e6
+    return np.asarray(X).nbytes / 1e6
+
+
+def _label_agreement(a, b):
+    return float(np.mean((a >= 0.5) == (b >= 0.5)))
+
+
+def _max_abs_diff(a, b):
+    return float(np.max(np.abs(a - b)))
+
+
+def float32_parity_report(X, y, scale=10, test_size=0.2, random_state=42):
+    """Train and score the pipeline in float64 and float32 on ``scale`` copies of the data.
+
+    The default float64 pipeline uses liblinear and the float32 one lbfgs, so a
+    float64 + lbfgs run is included as well. Returns a per-run table (memory,
+    timings, throughput, accuracy) and a dict that separates the precision
+    effect (float64 vs float32, both lbfgs) from the solver effect (liblinear
+    vs lbfgs, both float64).
+    """
+    X = pd.concat([X] * scale, ignore_index=True)
+    y = pd.concat([y] * scale, ignore_index=True)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=random_state, stratify=y
+    )
+
+    runs = [
+        ("float64 / liblinear", np.float64, "liblinear"),
+        ("float64 / lbfgs", np.float64, "lbfgs"),
+        ("float32 / lbfgs", np.float32, "lbfgs"),
+    ]
+    rows, proba = [], {}
+    for name, dtype, solver in runs:
+        start = time.perf_counter()
+        X_fit = to_float32(X_train) if dtype is np.float32 else X_train
+        load_seconds = time.perf_counter() - start
+
+        model = make_model(X_fit, dtype, solver)
+        start = time.perf_counter()
+        model.fit(X_fit, y_train)
+        fit_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        transformed = model[:-1].transform(X_test)
+        transform_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        proba[name] = model.predict_proba(X_test)[:, 1]
+        score_seconds = time.perf_counter() - start
+
+        y_pred = (proba[name] >= 0.5).astype(int)
+        rows.append({
+            "run": name,
+            "numeric_input_mb": X_fit.select_dtypes(include="number").memory_usage(index=False).sum() / 1e6,
+            "transformed_test_mb": _megabytes(transformed),
+            "cast_seconds": load_seconds,
+            "fit_seconds": fit_seconds,
+            "transform_seconds": transform_seconds,
+            "score_rows_per_s": len(X_test) / score_seconds,
+            "accuracy": accuracy_score(y_test, y_pred),
+            "f1": f1_score(y_test, y_pred),
+        })
+
+    parity = {
+        "rows_trained": len(X_train),
+        "rows_scored": len(X_test),
+        "label_agreement": _label_agreement(proba["float64 / lbfgs"], proba["float32 / lbfgs"]),
+        "max_abs_probability_diff": _max_abs_diff(proba["float64 / lbfgs"], proba["float32 / lbfgs"]),
+        "solver_label_agreement": _label_agreement(proba["float64 / liblinear"], proba["float64 / lbfgs"]),
+        "solver_max_abs_probability_diff": _max_abs_diff(proba["float64 / liblinear"], proba["float64 / lbfgs"]),
+    }
+    return pd.DataFrame(rows).set_index("run"), parity
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Float32 vs float64 parity report")
+    parser.add_argument("--csv", default="student_depression_dataset.csv")
+    parser.add_argument("--scale", type=int, default=10, help="copies of the dataset to stack")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.csv)
+    X = df.drop(columns=["id", "City", "Depression"], errors="ignore")
+    table, parity = float32_parity_report(X, df["Depression"], scale=args.scale)
+    print(table.T.to_string(float_format=lambda v: f"{v:.4f}"))
+    print()
+    for key, value in parity.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@
 import streamlit as st
 import pandas as pd
 
+from drift import DriftMonitor, build_reference
+
 # ---------------- Page Config ----------------
 st.set_page_config(
     page_title="Student Depression Predictor",
@@ -37,6 +39,15 @@ st.markdown("""
 
 st.markdown("---")
 
+# ---------------- Drift Monitor (shared by all sessions) ----------------
+@st.cache_resource
+def get_drift_monitor():
+    reference = build_reference(pd.read_csv("student_depression_dataset.csv"))
+    return DriftMonitor(reference)
+
+
+monitor = get_drift_monitor()
+
 # ---------------- Get Model and Features from Session ----------------
 model = st.session_state.get("model", None)
 features = st.session_state.get("features", None)
@@ -105,9 +116,11 @@ else:
             "Family History of Mental Illness": family_history
         }])
 
-        # Predict using session-state model
-        prediction = model.predict(input_data)[0]
+        # Predict using session-state model and the cut-off chosen on the training page
+        threshold = st.session_state.get("threshold", 0.5)
         probability = model.predict_proba(input_data)[0][1] if hasattr(model, "predict_proba") else None
+        prediction = int(probability >= threshold) if probability is not None else model.predict(input_data)[0]
+        monitor.update(input_data.iloc[0].to_dict())
 
         # ---------------- Highlighted Prediction Box ----------------
         if prediction == 1:
@@ -123,7 +136,7 @@ else:
                 box-shadow: 4px 4px 15px rgba(0,0,0,0.3);">
                 Depressed<br>
                 <span style="font-size:18px; font-weight:normal;">
-                Probability: {probability:.2f} — Immediate support is recommended
+                Probability: {probability:.2f} (threshold {threshold:.2f}) — Immediate support is recommended
                 </span>
             </div>
             """, unsafe_allow_html=True)
@@ -140,7 +153,17 @@ else:
                 box-shadow: 4px 4px 15px rgba(0,0,0,0.3);">
                 Not Depressed<br>
                 <span style="font-size:18px; font-weight:normal;">
-                Probability: {probability:.2f} — Continue maintaining wellbeing
+                Probability: {probability:.2f} (threshold {threshold:.2f}) — Continue maintaining wellbeing
                 </span>
             </div>
             """, unsafe_allow_html=True)
+
+# ---------------- Input Drift Status ----------------
+drift_status = monitor.status()
+st.sidebar.markdown("### 📡 Input Drift")
+st.sidebar.metric("Scored records", drift_status["records"])
+st.sidebar.metric("Drift status", drift_status["status"].title())
+if drift_status["drifted"]:
+    st.sidebar.caption("Shifted features: " + ", ".join(drift_status["drifted"]))
+with st.expander("Input drift vs. training data (PSI / KS)"):
+    st.dataframe(monitor.feature_report(), use_container_width=True)
@@ -0,0 +1,61 @@
+# ==============================
+# Precomputed risk cube for cohort drill-down
+# ==============================
+from itertools import combinations
+
+import pandas as pd
+
+CUBE_DIMENSIONS = ["City", "Degree", "Profession", "Gender", "Sleep Duration"]
+MEASURES = ["count", "proba_sum", "positive_sum"]
+
+
+def build_risk_cube(model, df, dimensions=CUBE_DIMENSIONS, threshold=0.5):
+    """Score ``df`` once and aggregate every subset of ``dimensions``.
+
+    Returns a dict mapping a tuple of dimensions (in ``dimensions`` order) to a
+    DataFrame of additive measures, so any group-by/filter query is answered
+    from the matching cuboid without touching raw rows.
+    """
+    dimensions = list(dimensions)
+    features = list(model.feature_names_in_)
+    proba = model.predict_proba(df[features])[:, 1]
+
+    scored = df[dimensions].astype(str)
+    scored["count"] = 1
+    scored["proba_sum"] = proba
+    scored["positive_sum"] = (proba >= threshold).astype(int)
+    base = scored.groupby(dimensions, sort=False)[MEASURES].sum().reset_index()
+
+    cube = {tuple(dimensions): base}
+    for size in range(len(dimensions) - 1, -1, -1):
+        for dims in combinations(dimensions, size):
+            if dims:
+                cube[dims] = base.groupby(list(dims), sort=False)[MEASURES].sum().reset_index()
+            else:
+                cube[dims] = base[MEASURES].sum().to_frame().T
+    return cube
+
+
+def query_cube(cube, group_by=(), filters=None):
+    """Slice the cube by ``filters`` ({dimension: [values]}) and roll up to ``group_by``."""
+    filters = {dim: values for dim, values in (filters or {}).items() if values}
+    order = max(cube, key=len)
+    needed = set(group_by) | set(filters)
+    cuboid = cube[tuple(dim for dim in order if dim in needed)]
+
+    mask = pd.Series(True, index=cuboid.index)
+    for dim, values in filters.items():
+        mask &= cuboid[dim].isin([str(v) for v in values])
+    sliced = cuboid[mask]
+
+    group_by = list(group_by)
+    if group_by:
+        result = sliced.groupby(group_by, sort=False)[MEASURES].sum().reset_index()
+    else:
+        result = sliced[MEASURES].sum().to_frame().T
+
+    result["count"] = result["count"].astype(int)
+    result["Mean Probability"] = result["proba_sum"] / result["count"]
+    result["Predicted Positive Rate"] = result["positive_sum"] / result["count"]
+    result = result.drop(columns=["proba_sum", "positive_sum"]).rename(columns={"count": "Students"})
+    return result.sort_values("Mean Probability", ascending=False).reset_index(drop=True)
@@ -0,0 +1,81 @@
+# ==============================
+# "Similar students" nearest-neighbour index
+# ==============================
+import joblib
+import numpy as np
+from scipy import sparse
+from sklearn.cluster import KMeans
+
+from model_store import MODEL_CACHE_DIR
+
+
+def _dense(X):
+    return X.toarray() if sparse.issparse(X) else np.asarray(X, dtype=float)
+
+
+class SimilarStudents:
+    """Inverted-file index over the ColumnTransformer output of the training rows.
+
+    The training rows are quantized into k-means cells and stored cell by cell.
+    A query ranks the cell centroids, then computes exact distances only to
+    the rows in its ``n_probe`` nearest cells. Space-partitioning trees degrade
+    to near brute force in the ~70-dimensional one-hot space; scanning a few
+    cells keeps lookups well under a millisecond. Queries must be transformed
+    with the same fitted preprocessor. ``labels`` are the training row labels,
+    so callers can look the neighbours up in the original DataFrame.
+    """
+
+    def __init__(self, centroids, offsets, points, norms, outcomes, labels, n_probe):
+        self.centroids = centroids
+        self.offsets = offsets
+        self.points = points
+        self.norms = norms
+        self.outcomes = outcomes
+        self.labels = labels
+        self.n_probe = n_probe
+
+    @classmethod
+    def build(cls, X_transformed, y, labels=None, n_cells=128, n_probe=12, random_state=42):
+        X = _dense(X_transformed)
+        y = np.asarray(y)
+        labels = np.arange(len(y)) if labels is None else np.asarray(labels)
+        n_cells = min(n_cells, len(X))
+        cells = KMeans(n_clusters=n_cells, n_init=1, random_state=random_state).fit(X)
+
+        order = np.argsort(cells.labels_, kind="stable")
+        offsets = np.r_[0, np.cumsum(np.bincount(cells.labels_, minlength=n_cells))]
+        points = np.ascontiguousarray(X[order])
+        return cls(cells.cluster_centers_, offsets, points, (points ** 2).sum(axis=1),
+                   y[order], labels[order], min(n_probe, n_cells))
+
+    def _query_one(self, q, k):
+        cell_dist = ((self.centroids - q) ** 2).sum(axis=1)
+        probe = np.argpartition(cell_dist, self.n_probe - 1)[:self.n_probe]
+        candidates = np.concatenate([np.arange(self.offsets[c], self.offsets[c + 1]) for c in probe])
+        if len(candidates) < k:
+            candidates = np.arange(len(self.points))
+
+        dist = self.norms[candidates] - 2 * self.points[candidates] @ q + q @ q
+        k = min(k, len(candidates))
+        top = np.argpartition(dist, k - 1)[:k]
+        top = top[np.argsort(dist[top])]
+        return candidates[top], np.sqrt(np.maximum(dist[top], 0))
+
+    def query(self, X_transformed, k=10):
+        """Labels and distances of the k closest students plus their Depression rate, per query row."""
+        Q = _dense(X_transformed)
+        found = [self._query_one(q, k) for q in Q]
+        positions = np.array([p for p, _ in found])
+        distances = np.array([d for _, d in found])
+        return self.labels[positions], distances, self.outcomes[positions].mean(axis=1)
+
+
+def load_or_build(X_transformed, y, version, labels=None, cache_dir=MODEL_CACHE_DIR):
+    """Load the index persisted for this model version, building and saving it on first use."""
+    path = cache_dir / f"neighbours-{version}.joblib"
+    if path.exists():
+        return joblib.load(path)
+    index = SimilarStudents.build(X_transformed, y, labels=labels)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    joblib.dump(index, path)
+    return index
@@ -0,0 +1,64 @@
+# ==============================
+# Shared pipeline building blocks for the training and recommendation pages
+# ==============================
+import numpy as np
+from sklearn.pipeline import Pipeline
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import StandardScaler, OneHotEncoder, FunctionTransformer
+from sklearn.linear_model import LogisticRegression
+
+NUMERIC_DTYPES = ["int64", "float64", "float32"]
+
+SOLVER_SETTINGS = {
+    "liblinear": {"solver": "liblinear"},
+    "lbfgs": {"solver": "lbfgs", "max_iter": 1000},
+}
+
+
+def to_float32(X):
+    """Cast the numeric columns of a DataFrame to float32."""
+    numeric = X.select_dtypes(include=NUMERIC_DTYPES).columns
+    return X.astype({col: np.float32 for col in numeric})
+
+
+def make_preprocessor(X, dtype=np.float64):
+    numeric_features = X.select_dtypes(include=NUMERIC_DTYPES).columns.tolist()
+    categorical_features = X.select_dtypes(include=["object"]).columns.tolist()
+
+    numeric_transformer = Pipeline([
+        ("imputer", SimpleImputer(strategy="mean")),
+        ("scaler", StandardScaler())
+    ])
+    categorical_transformer = Pipeline([
+        ("imputer", SimpleImputer(strategy="most_frequent")),
+        ("onehot", OneHotEncoder(handle_unknown="ignore", dtype=dtype))
+    ])
+
+    return ColumnTransformer([
+        ("num", numeric_transformer, numeric_features),
+        ("cat", categorical_transformer, categorical_features)
+    ])
+
+
+def solver_settings(dtype=np.float64, solver=None):
+    """LogisticRegression solver arguments; the solver defaults to the one suited to ``dtype``."""
+    if solver is None:
+        # liblinear always trains on a float64 copy; lbfgs keeps float32 end to end
+        solver = "lbfgs" if np.dtype(dtype) == np.float32 else "liblinear"
+    return SOLVER_SETTINGS[solver]
+
+
+def make_classifier(dtype=np.float64, solver=None):
+    return LogisticRegression(penalty='l2', C=0.030733777087956198, **solver_settings(dtype, solver))
+
+
+def make_model(X, dtype=np.float64, solver=None):
+    """Full pipeline; in float32 mode a leading cast step keeps scoring in float32 too."""
+    steps = [
+        ("preprocessor", make_preprocessor(X, dtype)),
+        ("classifier", make_classifier(dtype, solver))
+    ]
+    if np.dtype(dtype) == np.float32:
+        steps.insert(0, ("float32", FunctionTransformer(to_float32)))
+    return Pipeline(steps)